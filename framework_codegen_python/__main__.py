@@ -1,6 +1,7 @@
 # Auto-generated by framework_codegen_python. DO NOT EDIT.
 from __future__ import annotations
 
+import logging
 import sys
 from typing import List, Dict
 
@@ -9,6 +10,8 @@ from google.protobuf.compiler import plugin_pb2 as plugin
 # Import from generators module
 from .generators import RemoteServiceInfo, make_route_key, ensure_no_streaming_methods
 
+logger = logging.getLogger(__name__)
+
 
 def main() -> int:
     """Main entry point for the protoc plugin."""
@@ -18,6 +21,7 @@ def main() -> int:
 
     # Parse parameters
     parameters = parse_parameters(request.parameter)
+    configure_logging(parameters.get("LogLevel", ""))
 
     # Parse LocalFiles (unified parameter name)
     local_files_str = parameters.get("LocalFiles", "")
@@ -34,35 +38,42 @@ def main() -> int:
                 if file_path and actr_type:
                     remote_file_to_actr_type[file_path] = actr_type
                 else:
-                    print(f"WARNING: Invalid mapping pair: {pair}", file=sys.stderr)
+                    logger.warning("Invalid mapping pair: %s", pair)
             else:
-                print(f"WARNING: Invalid mapping format (missing '='): {pair}", file=sys.stderr)
+                logger.warning("Invalid mapping format (missing '='): %s", pair)
     
-    print(f"DEBUG: Parsed {len(remote_file_to_actr_type)} remote file mappings", file=sys.stderr)
-    print(f"DEBUG: Parsed {len(local_files_set)} local files", file=sys.stderr)
+    logger.debug("Parsed %d remote file mappings", len(remote_file_to_actr_type))
+    logger.debug("Parsed %d local files", len(local_files_set))
  
-    # First pass: Collect info about all Remote services
+    # Import strategy classes
+    from .strategies import GenerationContext, StrategySelector
+    from .concrete_strategies import (
+        create_default_strategies,
+        DefaultClientWorkloadStrategy,
+    )
+
+    # Create generation context; it owns path normalization, so both passes
+    # agree on which files are remote. remote_services is filled in below.
     remote_services: List[RemoteServiceInfo] = []
+    context = GenerationContext(
+        remote_file_to_actr_type=remote_file_to_actr_type,
+        local_files_set=local_files_set,
+        remote_services=remote_services,
+    )
+
+    # First pass: Collect info about all Remote services
     for file_desc in request.proto_file:
-        # Normalize file path for comparison
-        normalized_file_name = file_desc.name.replace("\\", "/")
-        
-        # Determine if this file is remote
-        is_remote = normalized_file_name in remote_file_to_actr_type
-        
-        if is_remote:
+        if context.is_remote(file_desc):
             # Get actr_type for this file from the mapping
-            actr_type = remote_file_to_actr_type.get(normalized_file_name, "")
+            actr_type = context.remote_actr_type(file_desc)
             
             # Critical: Do NOT fallback - fail fast if actr_type is missing
             if not actr_type:
-                print(
-                    f"ERROR: Remote file '{file_desc.name}' found but has no actr_type mapping.",
-                    file=sys.stderr
+                logger.error(
+                    "Remote file '%s' found but has no actr_type mapping.", file_desc.name
                 )
-                print(
-                    f"Available mappings: {list(remote_file_to_actr_type.keys())}",
-                    file=sys.stderr
+                logger.error(
+                    "Available mappings: %s", list(context.remote_file_to_actr_type.keys())
                 )
                 sys.exit(1)
             
@@ -78,9 +89,9 @@ def main() -> int:
                         actr_type=actr_type
                     )
                 )
-                print(
-                    f"INFO: Registered remote service '{service.name}' with actr_type '{actr_type}'",
-                    file=sys.stderr
+                logger.info(
+                    "Registered remote service '%s' with actr_type '%s'",
+                    service.name, actr_type,
                 )
 
 
@@ -88,20 +99,6 @@ def main() -> int:
     response = plugin.CodeGeneratorResponse()
     response.supported_features = plugin.CodeGeneratorResponse.FEATURE_PROTO3_OPTIONAL
 
-    # Import strategy classes
-    from .strategies import GenerationContext, StrategySelector
-    from .concrete_strategies import (
-        create_default_strategies,
-        DefaultClientWorkloadStrategy,
-    )
-
-    # Create generation context
-    context = GenerationContext(
-        remote_file_to_actr_type=remote_file_to_actr_type,
-        local_files_set=local_files_set,
-        remote_services=remote_services,
-    )
-
     # Create strategy selector with default strategies
     selector = StrategySelector(create_default_strategies())
 
@@ -113,10 +110,7 @@ def main() -> int:
 
         # Skip files without services and not explicitly marked as local
         if not file_desc.service and not context.is_local(file_desc):
-            print(
-                f"DEBUG: Skipping file '{file_desc.name}' (no services, not local)",
-                file=sys.stderr
-            )
+            logger.debug("Skipping file '%s' (no services, not local)", file_desc.name)
             continue
 
         # Select and apply the appropriate strategy
@@ -163,6 +157,26 @@ def main() -> int:
     return 0
 
 
+def configure_logging(level_name: str) -> None:
+    """Send diagnostics to stderr at the level given by the LogLevel parameter."""
+    level = logging.WARNING
+    invalid = False
+    if level_name:
+        named_level = logging.getLevelName(level_name.upper())
+        if isinstance(named_level, int):
+            level = named_level
+        else:
+            invalid = True
+    
+    logging.basicConfig(
+        stream=sys.stderr,
+        level=level,
+        format="%(levelname)s: %(message)s",
+    )
+    if invalid:
+        logger.warning("Unknown LogLevel '%s', using WARNING", level_name)
+
+
 def parse_parameters(param_str: str) -> Dict[str, str]:
     """Parse protoc plugin parameters in key=value format."""
     if not param_str:
@@ -4,15 +4,19 @@ Concrete strategy implementations for different code generation scenarios.
 
 from __future__ import annotations
 
+import logging
 import sys
-from typing import List
+from typing import ClassVar, List
 
+from . import generators
 from .strategies import (
     GenerationStrategy,
     GenerationContext,
     GeneratedFile,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class EmptyLocalWorkloadStrategy(GenerationStrategy):
     """
@@ -27,13 +31,9 @@ class EmptyLocalWorkloadStrategy(GenerationStrategy):
     - Empty workload with remote service proxies
     """
     
-    @property
-    def priority(self) -> int:
-        return 1  # Highest priority
-    
-    @property
-    def name(self) -> str:
-        return "EmptyLocalWorkload"
+    priority: ClassVar[int] = 1  # Highest priority
+    name: ClassVar[str] = "EmptyLocalWorkload"
+    selects_on_predicates_only: ClassVar[bool] = True
     
     def can_handle(self, file_desc, context: GenerationContext) -> bool:
         return (
@@ -47,22 +47,17 @@ class EmptyLocalWorkloadStrategy(GenerationStrategy):
         file_desc, 
         context: GenerationContext
     ) -> List[GeneratedFile]:
-        from . import generators
-        
-        output = generators.generate_empty_local_workload(
+        generated_file = generators.generate_empty_local_workload(
             file_desc.package,
             file_desc.name,
             context.remote_services,
         )
         
-        context.has_local_workload = True
+        context.local_workload_count += 1
         
-        print(
-            f"INFO: Generated empty local workload for '{file_desc.name}'",
-            file=sys.stderr
-        )
+        logger.info("Generated empty local workload for '%s'", file_desc.name)
         
-        return [GeneratedFile(name=output["name"], content=output["content"])]
+        return [generated_file]
 
 
 class RemoteServiceStrategy(GenerationStrategy):
@@ -77,13 +72,9 @@ class RemoteServiceStrategy(GenerationStrategy):
     - RPC request extensions only (client-side interfaces)
     """
     
-    @property
-    def priority(self) -> int:
-        return 2
-    
-    @property
-    def name(self) -> str:
-        return "RemoteService"
+    priority: ClassVar[int] = 2
+    name: ClassVar[str] = "RemoteService"
+    selects_on_predicates_only: ClassVar[bool] = True
     
     def can_handle(self, file_desc, context: GenerationContext) -> bool:
         return context.is_remote(file_desc)
@@ -93,26 +84,21 @@ class RemoteServiceStrategy(GenerationStrategy):
         file_desc, 
         context: GenerationContext
     ) -> List[GeneratedFile]:
-        from . import generators
-        
-        generated_files = []
-        
-        for service in file_desc.service:
-            output = generators.generate_remote_extensions_only(
+        generated_files = [
+            generators.generate_remote_extensions_only(
                 file_desc.package,
                 file_desc.name,
                 service.name,
                 service.method,
             )
-            
-            generated_files.append(
-                GeneratedFile(name=output["name"], content=output["content"])
-            )
-            
-            print(
-                f"INFO: Generated remote extensions for service '{service.name}' "
-                f"in file '{file_desc.name}'",
-                file=sys.stderr
+            for service in file_desc.service
+        ]
+        
+        if generated_files and logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Generated remote extensions for services [%s] in file '%s'",
+                ", ".join(service.name for service in file_desc.service),
+                file_desc.name,
             )
         
         return generated_files
@@ -132,13 +118,9 @@ class LocalServiceStrategy(GenerationStrategy):
     - Remote service proxies (if dependencies exist)
     """
     
-    @property
-    def priority(self) -> int:
-        return 3
-    
-    @property
-    def name(self) -> str:
-        return "LocalService"
+    priority: ClassVar[int] = 3
+    name: ClassVar[str] = "LocalService"
+    selects_on_predicates_only: ClassVar[bool] = True
     
     def can_handle(self, file_desc, context: GenerationContext) -> bool:
         return (
@@ -151,33 +133,35 @@ class LocalServiceStrategy(GenerationStrategy):
         file_desc, 
         context: GenerationContext
     ) -> List[GeneratedFile]:
-        from . import generators
+        # Use package_name (which now contains project name) for filename
+        # e.g., package "echo_app" -> "echo_app_service_actor.py"
+        # This ensures consistency with template expectations
+        package = sys.intern(file_desc.package)
+        package_snake_base = generators.to_snake_case(package) if package else None
         
-        generated_files = []
-        
-        for service in file_desc.service:
-            output = generators.generate_local_actor_code(
-                package_name=file_desc.package,
-                proto_name=file_desc.name,
-                service_name=service.name,
-                methods=service.method,
-                remote_services=context.remote_services,
+        generated_files = [
+            GeneratedFile(
+                name=f"{package_snake_base or generators.to_snake_case(service.name)}_service_actor.py",
+                content=generators.generate_local_actor_code(
+                    package_name=package,
+                    proto_name=file_desc.name,
+                    service_name=service.name,
+                    methods=service.method,
+                    remote_services=context.remote_services,
+                ),
             )
-            
-            # Use package_name (which now contains project name) for filename
-            # e.g., package "echo_app" -> "echo_app_service_actor.py"
-            # This ensures consistency with template expectations
-            package_snake = generators.to_snake_case(file_desc.package) if file_desc.package else generators.to_snake_case(service.name)
-            file_name = f"{package_snake}_service_actor.py"
-            generated_files.append(GeneratedFile(name=file_name, content=output))
-            
-            print(
-                f"INFO: Generated local actor code for service '{service.name}' "
-                f"in file '{file_desc.name}' as '{file_name}'",
-                file=sys.stderr
+            for service in file_desc.service
+        ]
+        
+        if generated_files and logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Generated local actor code for services [%s] in file '%s' as [%s]",
+                ", ".join(service.name for service in file_desc.service),
+                file_desc.name,
+                ", ".join(generated.name for generated in generated_files),
             )
         
-        context.has_local_workload = True
+        context.local_workload_count += 1
         
         return generated_files
 
@@ -194,13 +178,9 @@ class DefaultClientWorkloadStrategy(GenerationStrategy):
     This strategy should be applied after all file-based strategies.
     """
     
-    @property
-    def priority(self) -> int:
-        return 999  # Lowest priority (fallback)
-    
-    @property
-    def name(self) -> str:
-        return "DefaultClientWorkload"
+    priority: ClassVar[int] = 999  # Lowest priority (fallback)
+    name: ClassVar[str] = "DefaultClientWorkload"
+    selects_on_predicates_only: ClassVar[bool] = True
     
     def can_handle(self, file_desc, context: GenerationContext) -> bool:
         # This strategy is handled separately in the main loop
@@ -219,7 +199,7 @@ class DefaultClientWorkloadStrategy(GenerationStrategy):
         """Check if default workload should be generated."""
         return (
             len(context.remote_services) > 0 and
-            not context.has_local_workload
+            context.local_workload_count == 0
         )
     
     @staticmethod
@@ -227,16 +207,11 @@ class DefaultClientWorkloadStrategy(GenerationStrategy):
         context: GenerationContext
     ) -> GeneratedFile:
         """Generate default client workload."""
-        from . import generators
+        generated_file = generators.generate_client_workload(context.remote_services)
         
-        output = generators.generate_client_workload(context.remote_services)
-        
-        print(
-            f"INFO: Generated default client workload (no local services found)",
-            file=sys.stderr
-        )
+        logger.info("Generated default client workload (no local services found)")
         
-        return GeneratedFile(name=output["name"], content=output["content"])
+        return generated_file
 
 
 def create_default_strategies() -> List[GenerationStrategy]:
@@ -6,13 +6,19 @@ This module contains all the code generation logic for Python protobuf files.
 
 from __future__ import annotations
 
+import functools
+import re
 from typing import List, Dict
 from dataclasses import dataclass
 
+from .strategies import GeneratedFile
 
-@dataclass
+
+@dataclass(frozen=True)
 class RemoteServiceInfo:
     """Information about a remote service for proxying."""
+    __slots__ = ("service_name", "route_keys", "actr_type")
+    
     service_name: str
     route_keys: List[str]
     actr_type: str  # e.g., "acme+DataStreamConcurrentServer"
@@ -26,7 +32,7 @@ def generate_empty_local_workload(
     package_name: str,
     proto_name: str,
     remote_services: List[RemoteServiceInfo],
-) -> dict:
+) -> GeneratedFile:
     """Generate a workload for an empty local proto that proxies remote services."""
     pkg_name = package_name.replace(".", "_").title() if package_name else "Client"
     workload_name = f"{pkg_name}Workload"
@@ -49,7 +55,7 @@ def generate_empty_local_workload(
     ]
     
     content = "\n\n".join(section for section in sections if section)
-    return {"name": file_name, "content": content}
+    return GeneratedFile(name=file_name, content=content)
 
 
 def generate_remote_extensions_only(
@@ -57,7 +63,7 @@ def generate_remote_extensions_only(
     proto_name: str,
     service_name: str,
     methods,
-) -> dict:
+) -> GeneratedFile:
     """Generate RPC request extensions only (for remote services)."""
     proto_module = proto_module_name(proto_name)
     
@@ -84,7 +90,7 @@ def generate_remote_extensions_only(
     ]
     
     content = "\n\n".join(section for section in sections if section)
-    return {"name": file_name, "content": content}
+    return GeneratedFile(name=file_name, content=content)
 
 
 def proto_module_name(proto_name: str) -> str:
@@ -320,7 +326,7 @@ def generate_empty_workload_with_proxy(
 
 def generate_client_workload(
     remote_services: List[RemoteServiceInfo],
-) -> dict:
+) -> GeneratedFile:
     """Generate a generic client workload for proxying remote services only.
     
     This is used when a client has remote service dependencies but no local proto files.
@@ -332,7 +338,7 @@ def generate_client_workload(
     sections: List[str] = [preamble, dispatcher, workload]
     content = "\n\n".join(section for section in sections if section)
     
-    return {"name": "default_workload.py", "content": content}
+    return GeneratedFile(name="default_workload.py", content=content)
 
 
 def generate_client_preamble() -> str:
@@ -396,9 +402,9 @@ def extract_message_type(full_type: str) -> str:
     return full_type.split(".")[-1]
 
 
+@functools.lru_cache(maxsize=256)
 def to_snake_case(name: str) -> str:
     """Convert CamelCase to snake_case."""
-    import re
     s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
     return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
 
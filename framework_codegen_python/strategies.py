@@ -11,23 +11,31 @@ This module implements the Strategy pattern to handle different code generation
 from __future__ import annotations
 
 import abc
-import sys
-from typing import List, Dict, Optional, Any
+import itertools
+import logging
+import operator
+from typing import ClassVar, List, Dict, Optional, Any, Tuple, Union
 from dataclasses import dataclass
 
 from google.protobuf.compiler import plugin_pb2 as plugin
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+
+@dataclass(frozen=True)
 class GeneratedFile:
     """Represents a generated file."""
+    __slots__ = ("name", "content")
+    
     name: str
     content: str
 
 
-@dataclass
+@dataclass(frozen=True)
 class RemoteServiceInfo:
     """Information about a remote service for proxying."""
+    __slots__ = ("service_name", "route_keys", "actr_type")
+    
     service_name: str
     route_keys: List[str]
     actr_type: str  # e.g., "acme+DataStreamConcurrentServer"
@@ -36,26 +44,58 @@ class RemoteServiceInfo:
 class GenerationContext:
     """Context for code generation, shared across all strategies."""
     
+    __slots__ = (
+        "remote_file_to_actr_type",
+        "local_files_set",
+        "remote_services",
+        "local_workload_count",
+    )
+    
     def __init__(
         self,
         remote_file_to_actr_type: Dict[str, str],
         local_files_set: set,
         remote_services: List[RemoteServiceInfo],
     ):
-        self.remote_file_to_actr_type = remote_file_to_actr_type
-        self.local_files_set = local_files_set
+        # Normalize keys once here so lookups only need to normalize the
+        # (rare) descriptor names that contain backslashes.
+        self.remote_file_to_actr_type = {
+            self._normalize(path): actr_type
+            for path, actr_type in remote_file_to_actr_type.items()
+        }
+        self.local_files_set = {self._normalize(path) for path in local_files_set}
         self.remote_services = remote_services
-        self.has_local_workload = False
+        # Number of files for which a local workload was generated
+        self.local_workload_count = 0
+    
+    @staticmethod
+    def _normalize(name: str) -> str:
+        """Convert a proto file path to forward slashes."""
+        if "\\" in name:
+            return name.replace("\\", "/")
+        return name
     
     def is_remote(self, file_desc) -> bool:
         """Check if a file is a remote dependency."""
-        normalized_name = file_desc.name.replace("\\", "/")
-        return normalized_name in self.remote_file_to_actr_type
+        return self._normalize(file_desc.name) in self.remote_file_to_actr_type
+    
+    def remote_actr_type(self, file_desc) -> str:
+        """Return the actr_type mapped to a remote file, or "" if it has none."""
+        return self.remote_file_to_actr_type.get(self._normalize(file_desc.name), "")
     
     def is_local(self, file_desc) -> bool:
         """Check if a file is explicitly marked as local."""
-        normalized_name = file_desc.name.replace("\\", "/")
-        return normalized_name in self.local_files_set
+        return self._normalize(file_desc.name) in self.local_files_set
+    
+    @property
+    def has_local_workload(self) -> bool:
+        """Whether any strategy has generated a local workload."""
+        return self.local_workload_count > 0
+    
+    @has_local_workload.setter
+    def has_local_workload(self, value: bool) -> None:
+        # Kept for strategies that still set the flag instead of counting
+        self.local_workload_count = max(self.local_workload_count, 1) if value else 0
     
     def has_services(self, file_desc) -> bool:
         """Check if a file has service definitions."""
@@ -65,11 +105,48 @@ class GenerationContext:
 class GenerationStrategy(abc.ABC):
     """Abstract base class for code generation strategies."""
     
+    # Strategy priority (lower number = higher priority).
+    # Strategies are evaluated in priority order.
+    priority: ClassVar[int]
+    
+    # Strategy name for logging and debugging.
+    name: ClassVar[str]
+    
+    # Opt-in: set to True only if can_handle depends on nothing but the
+    # context predicates (is_remote, has_services, is_local). This lets
+    # StrategySelector resolve files with a precomputed decision tree.
+    selects_on_predicates_only: ClassVar[bool] = False
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Overriding can_handle invalidates an inherited opt-in unless the
+        # subclass restates it.
+        if "can_handle" in vars(cls) and "selects_on_predicates_only" not in vars(cls):
+            cls.selects_on_predicates_only = False
+        # Only enforce on concrete strategies; intermediate abstract bases
+        # may leave the class attributes to their own subclasses.
+        if any(
+            getattr(getattr(cls, attr, None), "__isabstractmethod__", False)
+            for attr in dir(cls)
+        ):
+            return
+        missing = [attr for attr in ("priority", "name") if not hasattr(cls, attr)]
+        if missing:
+            raise TypeError(
+                f"Strategy {cls.__name__} must define class attribute(s): "
+                f"{', '.join(missing)}"
+            )
+    
     @abc.abstractmethod
     def can_handle(self, file_desc, context: GenerationContext) -> bool:
         """
         Determine if this strategy can handle the given file.
         
+        If every strategy sets selects_on_predicates_only, StrategySelector
+        evaluates this once per predicate combination, with file_desc set
+        to None, rather than once per file. Otherwise it is called for
+        every file in priority order.
+        
         Args:
             file_desc: Proto file descriptor
             context: Generation context
@@ -96,22 +173,35 @@ class GenerationStrategy(abc.ABC):
             List of generated files
         """
         pass
+
+
+class _PredicateProbe:
+    """Stand-in context answering the selection predicates with fixed values."""
     
-    @property
-    @abc.abstractmethod
-    def priority(self) -> int:
-        """
-        Strategy priority (lower number = higher priority).
-        
-        Strategies are evaluated in priority order.
-        """
-        pass
+    def __init__(self, remote: bool, services: bool, local: bool):
+        self._remote = remote
+        self._services = services
+        self._local = local
     
-    @property
-    @abc.abstractmethod
-    def name(self) -> str:
-        """Strategy name for logging and debugging."""
-        pass
+    def is_remote(self, file_desc) -> bool:
+        return self._remote
+    
+    def has_services(self, file_desc) -> bool:
+        return self._services
+    
+    def is_local(self, file_desc) -> bool:
+        return self._local
+
+
+# Selection predicates in evaluation order.
+_SELECTION_PREDICATES = ("is_remote", "has_services", "is_local")
+
+# A decision tree node is either a leaf (the selected strategy, or None) or a
+# (predicate name, node if False, node if True) branch.
+_DecisionNode = Union[
+    Optional[GenerationStrategy],
+    Tuple[str, "_DecisionNode", "_DecisionNode"],
+]
 
 
 class StrategySelector:
@@ -124,7 +214,56 @@ class StrategySelector:
         Args:
             strategies: List of available strategies
         """
-        self.strategies = sorted(strategies, key=lambda s: s.priority)
+        self.strategies = sorted(strategies, key=operator.attrgetter("priority"))
+        
+        # When every strategy opts in to deciding purely on (is_remote,
+        # has_services, is_local), resolve all 8 combinations up front in
+        # priority order. Otherwise fall back to a per-file scan.
+        self._linear_scan = not all(
+            s.selects_on_predicates_only for s in self.strategies
+        )
+        self._decision_tree: _DecisionNode = None
+        if not self._linear_scan:
+            self._decision_tree = self._build_decision_tree(
+                self._probe_strategies(self.strategies), ()
+            )
+    
+    @staticmethod
+    def _probe_strategies(
+        strategies: List[GenerationStrategy],
+    ) -> Dict[Tuple[bool, bool, bool], Optional[GenerationStrategy]]:
+        """Resolve the selected strategy for each predicate combination."""
+        table: Dict[Tuple[bool, bool, bool], Optional[GenerationStrategy]] = {}
+        for key in itertools.product((False, True), repeat=3):
+            probe = _PredicateProbe(*key)
+            table[key] = next(
+                (s for s in strategies if s.can_handle(None, probe)),
+                None,
+            )
+        return table
+    
+    @staticmethod
+    def _build_decision_tree(
+        table: Dict[Tuple[bool, bool, bool], Optional[GenerationStrategy]],
+        prefix: Tuple[bool, ...],
+    ) -> _DecisionNode:
+        """
+        Fold the predicate table into a decision tree.
+        
+        Only used when every strategy sets selects_on_predicates_only.
+        Inner nodes are (predicate, if_false, if_true) tuples; leaves are the
+        selected strategy (or None). A predicate whose outcome doesn't change
+        the result is dropped, so e.g. remote files are resolved after
+        evaluating is_remote alone.
+        """
+        if len(prefix) == len(_SELECTION_PREDICATES):
+            return table[prefix]
+        
+        if_false = StrategySelector._build_decision_tree(table, prefix + (False,))
+        if_true = StrategySelector._build_decision_tree(table, prefix + (True,))
+        if if_false == if_true:
+            return if_false
+        return (_SELECTION_PREDICATES[len(prefix)], if_false, if_true)
     
     def select_strategy(
         self, 
@@ -132,7 +271,7 @@ class StrategySelector:
         context: GenerationContext
     ) -> Optional[GenerationStrategy]:
         """
-        Select the first strategy that can handle the file.
+        Select the highest-priority strategy that can handle the file.
         
         Args:
             file_desc: Proto file descriptor
@@ -141,16 +280,21 @@ class StrategySelector:
         Returns:
             Selected strategy or None if no strategy can handle the file
         """
-        for strategy in self.strategies:
-            if strategy.can_handle(file_desc, context):
-                print(
-                    f"DEBUG: Selected strategy '{strategy.name}' for file '{file_desc.name}'",
-                    file=sys.stderr
-                )
-                return strategy
+        if self._linear_scan:
+            strategy = next(
+                (s for s in self.strategies if s.can_handle(file_desc, context)),
+                None,
+            )
+        else:
+            strategy = self._decision_tree
+            while isinstance(strategy, tuple):
+                predicate, if_false, if_true = strategy
+                strategy = if_true if getattr(context, predicate)(file_desc) else if_false
+        if strategy is not None:
+            logger.debug(
+                "Selected strategy '%s' for file '%s'", strategy.name, file_desc.name
+            )
+            return strategy
         
-        print(
-            f"DEBUG: No strategy found for file '{file_desc.name}'",
-            file=sys.stderr
-        )
+        logger.debug("No strategy found for file '%s'", file_desc.name)
         return None
@@ -0,0 +1,222 @@
+import abc
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+from framework_codegen_python.concrete_strategies import (
+    DefaultClientWorkloadStrategy,
+    LocalServiceStrategy,
+    RemoteServiceStrategy,
+    create_default_strategies,
+)
+from framework_codegen_python.strategies import (
+    GenerationContext,
+    GenerationStrategy,
+    StrategySelector,
+)
+
+
+def make_file(name, services=()):
+    return SimpleNamespace(name=name, package="pkg", service=list(services))
+
+
+def make_context(remote=None, local=()):
+    return GenerationContext(
+        remote_file_to_actr_type=remote or {},
+        local_files_set=set(local),
+        remote_services=[],
+    )
+
+
+def describe(node):
+    """Render a decision tree with strategy names in place of instances."""
+    if isinstance(node, tuple):
+        predicate, if_false, if_true = node
+        return (predicate, describe(if_false), describe(if_true))
+    return None if node is None else node.name
+
+
+class LocalFirstStrategy(LocalServiceStrategy):
+    """Custom strategy that outranks the defaults for any LocalFiles entry."""
+
+    priority = 0
+    name = "LocalFirst"
+    selects_on_predicates_only = True
+
+    def can_handle(self, file_desc, context):
+        return context.is_local(file_desc)
+
+
+class FileNameStrategy(LocalServiceStrategy):
+    """Custom strategy that inspects the file descriptor itself."""
+
+    priority = 0
+    name = "FileName"
+
+    def can_handle(self, file_desc, context):
+        return file_desc.name.endswith("_special.proto")
+
+
+class NoneGuardedFileNameStrategy(LocalServiceStrategy):
+    """Custom strategy that tolerates a None file descriptor."""
+
+    priority = 0
+    name = "NoneGuardedFileName"
+
+    def can_handle(self, file_desc, context):
+        return file_desc is not None and file_desc.name.endswith("_x.proto")
+
+
+class RemoteServicesStrategy(LocalServiceStrategy):
+    """Custom strategy that reads context state beyond the predicates."""
+
+    priority = 0
+    name = "RemoteServices"
+
+    def can_handle(self, file_desc, context):
+        return bool(context.remote_services)
+
+
+def test_default_strategies_fold_into_short_circuit_tree():
+    selector = StrategySelector(create_default_strategies())
+
+    assert not selector._linear_scan
+    assert describe(selector._decision_tree) == (
+        "is_remote",
+        ("has_services", ("is_local", None, "EmptyLocalWorkload"), "LocalService"),
+        "RemoteService",
+    )
+
+
+def test_higher_priority_custom_strategy_is_kept_in_tree():
+    selector = StrategySelector(create_default_strategies() + [LocalFirstStrategy()])
+
+    assert describe(selector._decision_tree) == (
+        "is_remote",
+        (
+            "has_services",
+            ("is_local", None, "LocalFirst"),
+            ("is_local", "LocalService", "LocalFirst"),
+        ),
+        ("is_local", "RemoteService", "LocalFirst"),
+    )
+
+
+def test_select_strategy_follows_tree():
+    selector = StrategySelector(create_default_strategies())
+    context = make_context(remote={"remote/r.proto": "acme+R"}, local={"local/e.proto"})
+
+    assert selector.select_strategy(make_file("remote/r.proto", ["Svc"]), context).name == "RemoteService"
+    assert selector.select_strategy(make_file("local/s.proto", ["Svc"]), context).name == "LocalService"
+    assert selector.select_strategy(make_file("local/e.proto"), context).name == "EmptyLocalWorkload"
+    assert selector.select_strategy(make_file("other.proto"), context) is None
+
+
+def test_strategy_reading_file_desc_falls_back_to_per_file_scan():
+    selector = StrategySelector(create_default_strategies() + [FileNameStrategy()])
+    context = make_context(local={"a_special.proto"})
+
+    assert selector._linear_scan
+    assert selector.select_strategy(make_file("a_special.proto"), context).name == "FileName"
+    assert selector.select_strategy(make_file("b.proto", ["Svc"]), context).name == "LocalService"
+
+
+def test_none_guarded_strategy_is_not_folded_into_tree():
+    selector = StrategySelector(create_default_strategies() + [NoneGuardedFileNameStrategy()])
+    context = make_context()
+
+    assert selector._linear_scan
+    assert selector._decision_tree is None
+    assert selector.select_strategy(make_file("a_x.proto", ["Svc"]), context).name == "NoneGuardedFileName"
+    assert selector.select_strategy(make_file("b.proto", ["Svc"]), context).name == "LocalService"
+
+
+def test_strategy_reading_context_state_falls_back_to_per_file_scan():
+    selector = StrategySelector(create_default_strategies() + [RemoteServicesStrategy()])
+    context = make_context(local={"a.proto"})
+
+    assert selector._linear_scan
+    assert selector.select_strategy(make_file("a.proto"), context).name == "EmptyLocalWorkload"
+
+
+def test_overriding_can_handle_drops_inherited_predicate_opt_in():
+    assert LocalServiceStrategy.selects_on_predicates_only
+    assert not FileNameStrategy.selects_on_predicates_only
+    assert LocalFirstStrategy.selects_on_predicates_only
+
+
+def test_context_normalizes_backslash_paths_on_both_sides():
+    context = make_context(remote={"remote\\win.proto": "acme+Win"}, local={"local\\a.proto"})
+
+    assert context.is_remote(make_file("remote/win.proto"))
+    assert context.is_remote(make_file("remote\\win.proto"))
+    assert context.remote_actr_type(make_file("remote/win.proto")) == "acme+Win"
+    assert context.remote_actr_type(make_file("local/a.proto")) == ""
+    assert context.is_local(make_file("local/a.proto"))
+
+
+def test_remote_file_without_services_generates_and_logs_nothing(caplog):
+    context = make_context(remote={"remote/r.proto": "acme+R"}, local={"remote/r.proto"})
+
+    with caplog.at_level(logging.INFO):
+        generated = RemoteServiceStrategy().generate(make_file("remote/r.proto"), context)
+
+    assert generated == []
+    assert "Generated remote extensions" not in caplog.text
+
+
+def test_default_workload_only_without_local_workloads():
+    context = make_context()
+    assert not DefaultClientWorkloadStrategy.should_generate(context)
+
+    context.remote_services.append(object())
+    assert DefaultClientWorkloadStrategy.should_generate(context)
+
+    context.local_workload_count += 1
+    assert not DefaultClientWorkloadStrategy.should_generate(context)
+
+
+def test_has_local_workload_flag_maps_onto_counter():
+    context = make_context()
+
+    context.has_local_workload = True
+    assert context.local_workload_count == 1
+    context.local_workload_count = 3
+    context.has_local_workload = True
+    assert context.local_workload_count == 3
+    assert context.has_local_workload
+
+    context.has_local_workload = False
+    assert context.local_workload_count == 0
+    assert not context.has_local_workload
+
+
+def test_concrete_strategy_without_priority_or_name_is_rejected():
+    with pytest.raises(TypeError, match="priority, name"):
+
+        class Unnamed(GenerationStrategy):
+            def can_handle(self, file_desc, context):
+                return False
+
+            def generate(self, file_desc, context):
+                return []
+
+
+def test_abstract_intermediate_strategy_may_omit_priority_and_name():
+    class Base(GenerationStrategy):
+        @abc.abstractmethod
+        def can_handle(self, file_desc, context):
+            ...
+
+        def generate(self, file_desc, context):
+            return []
+
+    class Concrete(Base):
+        priority = 10
+        name = "Concrete"
+
+        def can_handle(self, file_desc, context):
+            return False
+
+    assert Concrete().priority == 10